@@ -4,11 +4,44 @@ Simple script to find YouTube channel ID from channel name or handle
 """
 
 import os
-from googleapiclient.discovery import build
-from dotenv import load_dotenv
+import json
 
-def find_channel_id(search_term, save_to_file=True):
-    """Find channel ID from search term"""
+# Optional faster JSON encoders (fall back to the standard library)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+CHANNEL_URL_PREFIX = "https://www.youtube.com/channel/"
+RESULT_SEPARATOR = "-" * 30
+
+
+def _dumps(obj, pretty=False):
+    """Serialize obj to UTF-8 encoded JSON bytes with the fastest available encoder"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if ujson is not None:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False,
+                           indent=2 if pretty else 0).encode('utf-8')
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def find_channel_id(search_term, save_to_file=True, pretty=False):
+    """Find channel ID from search term (saved JSON is compact unless pretty=True)"""
+    # Imported lazily: the API client stack is slow to import
+    from dotenv import load_dotenv
+    from youtube_client import get_youtube_client
+    
     load_dotenv()
     api_key = os.getenv('YOUTUBE_API_KEY')
     
@@ -16,7 +49,7 @@ def find_channel_id(search_term, save_to_file=True):
         print("Error: YOUTUBE_API_KEY not found in .env file")
         return
     
-    youtube = build('youtube', 'v3', developerKey=api_key)
+    youtube = get_youtube_client(api_key)
     
     try:
         # Search for channels
@@ -24,37 +57,44 @@ def find_channel_id(search_term, save_to_file=True):
             part='snippet',
             q=search_term,
             type='channel',
-            maxResults=10
+            maxResults=10,
+            fields='items/snippet(channelId,title,description)'
         )
         response = request.execute()
         
-        print(f"Search results for '{search_term}':")
-        print("=" * 50)
+        lines = [f"Search results for '{search_term}':", "=" * 50]
         
         results = []
         for i, item in enumerate(response.get('items', []), 1):
-            channel_id = item['snippet']['channelId']
-            title = item['snippet']['title']
-            description = item['snippet']['description'][:100] + "..." if len(item['snippet']['description']) > 100 else item['snippet']['description']
+            snippet = item['snippet']
+            channel_id = snippet['channelId']
+            title = snippet['title']
+            full_description = snippet['description']
+            description = full_description[:100] + "..." if len(full_description) > 100 else full_description
+            url = CHANNEL_URL_PREFIX + channel_id
             
             result = {
                 'rank': i,
                 'title': title,
                 'channel_id': channel_id,
                 'description': description,
-                'url': f"https://www.youtube.com/channel/{channel_id}"
+                'url': url
             }
             results.append(result)
             
-            print(f"{i}. Title: {title}")
-            print(f"   Channel ID: {channel_id}")
-            print(f"   Description: {description}")
-            print(f"   URL: https://www.youtube.com/channel/{channel_id}")
-            print("-" * 30)
+            lines.append(
+                f"{i}. Title: {title}\n"
+                f"   Channel ID: {channel_id}\n"
+                f"   Description: {description}\n"
+                f"   URL: {url}\n"
+                + RESULT_SEPARATOR
+            )
+        
+        # Print all results with a single write
+        print("\n".join(lines))
         
         # Save results to file if requested
         if save_to_file and results:
-            import json
             from datetime import datetime
             
             # Create result directory
@@ -66,14 +106,16 @@ def find_channel_id(search_term, save_to_file=True):
             clean_search = search_term.replace(' ', '_').replace('@', '').replace('/', '_')
             filename = f"{result_dir}/channel_search_{clean_search}_{timestamp}.json"
             
-            # Save to file
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'search_term': search_term,
-                    'timestamp': timestamp,
-                    'total_results': len(results),
-                    'results': results
-                }, f, indent=2, ensure_ascii=False)
+            payload = {
+                'search_term': search_term,
+                'timestamp': timestamp,
+                'total_results': len(results),
+                'results': results
+            }
+            
+            # Save to file (serialize in one shot, then a single write)
+            with open(filename, 'wb') as f:
+                f.write(_dumps(payload, pretty=pretty))
             
             print(f"\n💾 Results saved to: {filename}")
             
@@ -7,9 +7,15 @@ for working with YouTube video categories.
 """
 
 from typing import Dict, Optional
+from collections import Counter, defaultdict
+from operator import itemgetter
 import os
-from googleapiclient.discovery import build
-from dotenv import load_dotenv
+import sys
+from youtube_client import get_youtube_client
+
+
+# Categories fetched from the API, keyed by (api_key, region_code); they never change during a run
+_CATEGORY_CACHE: Dict[tuple, Dict[int, str]] = {}
 
 
 class YouTubeCategories:
@@ -50,6 +56,7 @@ class YouTubeCategories:
         43: "Shows",
         44: "Trailers"
     }
+    _DEFAULT_CATEGORIES_STR = {str(k): v for k, v in DEFAULT_CATEGORIES.items()}
     
     def __init__(self, api_key: str = None, region_code: str = 'US'):
         """
@@ -62,16 +69,19 @@ class YouTubeCategories:
         if api_key:
             self.api_key = api_key
         else:
+            from dotenv import load_dotenv
             load_dotenv()
             self.api_key = os.getenv('YOUTUBE_API_KEY')
         
         self.region_code = region_code
         self.youtube = None
-        self.categories = self.DEFAULT_CATEGORIES.copy()
+        # Shared with the class until the API provides a different mapping
+        self.categories = self.DEFAULT_CATEGORIES
+        self._index_categories()
         
         if self.api_key:
             try:
-                self.youtube = build('youtube', 'v3', developerKey=self.api_key)
+                self.youtube = get_youtube_client(self.api_key)
                 self._load_categories_from_api()
             except Exception as e:
                 print(f"Warning: Could not load categories from API: {e}")
@@ -79,22 +89,43 @@ class YouTubeCategories:
     
     def _load_categories_from_api(self):
         """Load categories from YouTube API for the specific region"""
+        cache_key = (self.api_key, self.region_code)
+        cached = _CATEGORY_CACHE.get(cache_key)
+        if cached is not None:
+            self.categories = cached
+            self._index_categories()
+            return
+        
         try:
             request = self.youtube.videoCategories().list(
                 part='snippet',
-                regionCode=self.region_code
+                regionCode=self.region_code,
+                fields='items(id,snippet/title)'
             )
             response = request.execute()
             
             # Update categories with API data
-            self.categories = {}
+            categories = {}
             for item in response.get('items', []):
                 category_id = int(item['id'])
                 title = item['snippet']['title']
-                self.categories[category_id] = title
+                categories[category_id] = title
+            
+            if categories and categories != self.DEFAULT_CATEGORIES:
+                self.categories = categories
+            _CATEGORY_CACHE[cache_key] = self.categories
                 
         except Exception as e:
             print(f"Warning: Could not load categories from API: {e}")
+        
+        self._index_categories()
+    
+    def _index_categories(self):
+        """Index category names by the string IDs the API returns"""
+        if self.categories is self.DEFAULT_CATEGORIES:
+            self._categories_str = self._DEFAULT_CATEGORIES_STR
+        else:
+            self._categories_str = {str(k): v for k, v in self.categories.items()}
     
     def get_category_name(self, category_id: str) -> str:
         """
@@ -106,6 +137,17 @@ class YouTubeCategories:
         Returns:
             Category name or 'Unknown' if not found
         """
+        # Fast path: API IDs are digit strings, so a single dict lookup suffices
+        if type(category_id) is str:
+            name = self._categories_str.get(category_id)
+            if name is not None:
+                return name
+            if category_id.isdecimal():
+                return self.categories.get(int(category_id), f"Unknown (ID: {category_id})")
+        elif type(category_id) is int:
+            return self.categories.get(category_id, f"Unknown (ID: {category_id})")
+        
+        # Anything else (padded strings, floats, None, ...) goes through int()
         try:
             cat_id = int(category_id)
             return self.categories.get(cat_id, f"Unknown (ID: {category_id})")
@@ -123,11 +165,11 @@ class YouTubeCategories:
     
     def print_categories(self):
         """Print all available categories"""
-        print(f"YouTube Video Categories (Region: {self.region_code}):")
-        print("=" * 50)
+        lines = [f"YouTube Video Categories (Region: {self.region_code}):", "=" * 50]
+        lines.extend(f"ID {cat_id:2d}: {name}" for cat_id, name in sorted(self.categories.items()))
         
-        for cat_id, name in sorted(self.categories.items()):
-            print(f"ID {cat_id:2d}: {name}")
+        # Emit the whole table with a single write
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def get_category_stats(self, videos_data: list) -> Dict[str, int]:
         """
@@ -139,14 +181,15 @@ class YouTubeCategories:
         Returns:
             Dictionary with category counts
         """
-        stats = {}
+        # Count raw IDs first, then resolve each distinct ID to a name once
+        counts = Counter(video.get('category_id', '') for video in videos_data)
         
-        for video in videos_data:
-            category_id = video.get('category_id', '')
-            category_name = self.get_category_name(category_id)
-            stats[category_name] = stats.get(category_name, 0) + 1
+        # Different IDs can share a name (e.g. "Comedy"), so merge their counts
+        stats = defaultdict(int)
+        for category_id, count in counts.items():
+            stats[self.get_category_name(category_id)] += count
         
-        return stats
+        return dict(stats)
     
     def print_category_stats(self, videos_data: list):
         """
@@ -161,15 +204,17 @@ class YouTubeCategories:
             print("No category data available")
             return
         
-        print("\n📊 Video Category Statistics:")
-        print("=" * 40)
+        lines = ["\n📊 Video Category Statistics:", "=" * 40]
         
         total_videos = sum(stats.values())
-        for category, count in sorted(stats.items(), key=lambda x: x[1], reverse=True):
-            percentage = (count / total_videos) * 100
-            print(f"{category:25s}: {count:3d} videos ({percentage:5.1f}%)")
+        scale = 100.0 / total_videos
+        for category, count in sorted(stats.items(), key=itemgetter(1), reverse=True):
+            lines.append("%-25s: %3d videos (%5.1f%%)" % (category, count, count * scale))
+        
+        lines.append("%-25s: %3d videos" % ('Total', total_videos))
         
-        print(f"{'Total':25s}: {total_videos:3d} videos")
+        # Emit the whole table with a single write
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+YouTube API Client Helper Module
+
+This module builds the YouTube Data API v3 client once per API key so that
+the discovery document is only parsed a single time per process, and shares
+one HTTP connection (with an on-disk response cache) between clients.
+Worker threads get their own client, since httplib2.Http is not thread-safe.
+"""
+
+import os
+import threading
+from functools import lru_cache
+
+HTTP_CACHE_DIR = os.path.join('.cache', 'httplib2')
+HTTP_TIMEOUT = 30  # Seconds (a multipart batch of 50 video requests can be slow)
+
+_thread_local = threading.local()
+
+
+def _new_http():
+    """Create an HTTP transport with keep-alive connections and a disk cache"""
+    import httplib2
+
+    return httplib2.Http(cache=HTTP_CACHE_DIR, timeout=HTTP_TIMEOUT)
+
+
+def _build_client(api_key: str, http):
+    """Build a YouTube Data API v3 client on top of the given HTTP transport"""
+    # Imported lazily: googleapiclient is slow to import
+    from googleapiclient.discovery import build
+
+    return build('youtube', 'v3', developerKey=api_key, http=http,
+                 cache_discovery=False, static_discovery=True)
+
+
+@lru_cache(maxsize=1)
+def get_http():
+    """
+    Get the shared HTTP transport used by all YouTube API clients
+
+    Returns:
+        httplib2.Http object with keep-alive connections and a disk cache
+    """
+    return _new_http()
+
+
+@lru_cache(maxsize=4)
+def get_youtube_client(api_key: str):
+    """
+    Get a (cached) YouTube Data API v3 client
+
+    Args:
+        api_key: YouTube Data API v3 key
+
+    Returns:
+        YouTube API resource object
+    """
+    return _build_client(api_key, get_http())
+
+
+def get_thread_youtube_client(api_key: str):
+    """
+    Get a YouTube Data API v3 client owned by the calling thread
+
+    Each thread keeps its own client and HTTP connection, so clients can be
+    used concurrently from a thread pool.
+
+    Args:
+        api_key: YouTube Data API v3 key
+
+    Returns:
+        YouTube API resource object
+    """
+    clients = getattr(_thread_local, 'clients', None)
+    if clients is None:
+        clients = _thread_local.clients = {}
+
+    client = clients.get(api_key)
+    if client is None:
+        client = clients[api_key] = _build_client(api_key, _new_http())
+    return client
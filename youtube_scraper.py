@@ -7,23 +7,112 @@ This script scrapes all video metadata from a YouTube channel including:
 """
 
 import os
+import re
+import csv
+import gzip
 import time
 import json
-import pandas as pd
-from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Callable, List, Dict, Iterator, Optional, Tuple
 from dataclasses import dataclass
 from tqdm import tqdm
 
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from dotenv import load_dotenv
 from youtube_categories import YouTubeCategories
+from youtube_client import get_youtube_client, get_thread_youtube_client
 
+# Optional faster JSON encoder (falls back to the standard library)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+# Partial-response mask: only the fields _parse_video_data reads
+VIDEO_FIELDS = (
+    'items('
+    'id,'
+    'snippet(title,description,channelTitle,publishedAt,tags,categoryId,defaultLanguage,'
+    'thumbnails(maxres/url,high/url,medium/url,default/url)),'
+    'statistics(viewCount,likeCount,commentCount),'
+    'contentDetails/duration'
+    ')'
+)
+
+# Adaptive rate limiting (AIMD): the delay between requests shrinks additively after
+# each success and grows multiplicatively whenever the API reports rate limiting
+RATE_LIMIT_STATUSES = (403, 429)
+RATE_LIMIT_DELAY_STEP = 0.1  # Seconds removed from the delay after each success
+RATE_LIMIT_MIN_BACKOFF = 1.0  # Seconds
+RATE_LIMIT_MAX_BACKOFF = 60.0  # Seconds
+
+# Retries for a single API request; the client backs off exponentially (with jitter)
+# on 5xx, 429 and rate-limit 403 responses
+API_NUM_RETRIES = 5
+
+# Thumbnail sizes, best quality first
+THUMBNAIL_PRIORITY = ('maxres', 'high', 'medium', 'default')
+
+# Column order of the CSV export
+CSV_COLUMNS = (
+    'video_id', 'url', 'title', 'description', 'channel_title', 'published_at', 'duration',
+    'view_count', 'like_count', 'comment_count', 'thumbnail_url', 'tags',
+    'category_id', 'category_name', 'language'
+)
+
+# ISO 8601 duration as returned by the API (e.g. PT4M13S, P1DT2H)
+DURATION_PATTERN = re.compile(r'P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?')
+
+
+# Timestamp format used by the API (UTC); strings in this form compare chronologically
+API_DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+FRACTIONAL_SECONDS_PATTERN = re.compile(r'(T\d{2}:\d{2}:\d{2})\.\d+')
+
+
+def _parse_rfc3339(value: str) -> datetime:
+    """
+    Parse an RFC 3339 / ISO 8601 timestamp into an aware UTC datetime
+    
+    Accepts 'Z' or numeric offsets and fractional seconds (which are dropped);
+    timestamps without an offset are taken as UTC. Raises ValueError if invalid.
+    """
+    value = FRACTIONAL_SECONDS_PATTERN.sub(r'\1', value.strip()).replace('Z', '+00:00').replace('z', '+00:00')
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+@lru_cache(maxsize=4096)
+def _format_duration(duration: str) -> str:
+    """Format an ISO 8601 duration as H:MM:SS or M:SS (durations repeat a lot, so results are cached)"""
+    match = DURATION_PATTERN.match(duration) if duration else None
+    if not match:
+        return '0:00'
+    
+    days, hours, minutes, seconds = (int(value or 0) for value in match.groups())
+    hours += days * 24
+    
+    if hours > 0:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    else:
+        return f"{minutes}:{seconds:02d}"
+
+
+@dataclass(frozen=True)
 class VideoMetadata:
     """Data class to store video metadata"""
+    # Explicit slots (no per-instance __dict__); dataclass(slots=True) needs Python 3.10+
+    __slots__ = (
+        'video_id', 'url', 'title', 'description', 'channel_title', 'published_at', 'duration',
+        'view_count', 'like_count', 'comment_count', 'thumbnail_url', 'tags', 'category_id', 'language'
+    )
+    
     video_id: str
     url: str
     title: str
@@ -35,9 +124,18 @@ class VideoMetadata:
     like_count: int
     comment_count: int
     thumbnail_url: str
-    tags: List[str]
+    tags: Tuple[str, ...]
     category_id: str
     language: str
+    
+    # Frozen + hand-written slots: copy/pickle must bypass the frozen __setattr__
+    # (this is what dataclass(slots=True) generates on Python 3.10+)
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
 
 class YouTubeChannelScraper:
@@ -51,46 +149,71 @@ class YouTubeChannelScraper:
             api_key: YouTube Data API v3 key
         """
         self.api_key = api_key
-        self.youtube = build('youtube', 'v3', developerKey=api_key)
-        self.rate_limit_delay = 0.1  # Delay between requests to respect rate limits
+        self.youtube = get_youtube_client(api_key)
+        self.rate_limit_delay = 0.0  # Delay between requests, adapted to rate-limit responses
+        self._rate_limit_lock = threading.Lock()  # Workers share the delay
+        self.max_workers = 8  # Concurrent video metadata requests
         self.categories = YouTubeCategories(api_key)  # Initialize categories helper
         
     def get_channel_id(self, channel_identifier: str) -> str:
         """
-        Get channel ID from username or channel ID
+        Get channel ID from handle, username or channel ID
         
         Args:
-            channel_identifier: Channel username or channel ID
+            channel_identifier: Channel handle (@name), username or channel ID
             
         Returns:
             Channel ID
         """
+        return self._resolve_channel(channel_identifier)[0]
+    
+    def _resolve_channel(self, channel_identifier: str) -> Tuple[str, str]:
+        """
+        Resolve a channel and its uploads playlist with a single API call per lookup
+        
+        Args:
+            channel_identifier: Channel handle (@name), username or channel ID
+            
+        Returns:
+            Tuple of (channel ID, uploads playlist ID)
+        """
+        channel_params = {
+            'part': 'id,contentDetails',
+            'fields': 'items(id,contentDetails/relatedPlaylists/uploads)',
+        }
+        
         try:
             # Try as channel ID first
             if channel_identifier.startswith('UC'):
-                request = self.youtube.channels().list(
-                    part='id',
-                    id=channel_identifier
-                )
-                response = request.execute()
-                if response['items']:
-                    return channel_identifier
+                request = self.youtube.channels().list(id=channel_identifier, **channel_params)
+                response = request.execute(num_retries=API_NUM_RETRIES)
+                if response.get('items'):
+                    return self._channel_ids_from_item(response['items'][0])
+            
+            # Try as handle (e.g. @GoogleDevelopers)
+            elif channel_identifier.startswith('@'):
+                request = self.youtube.channels().list(forHandle=channel_identifier, **channel_params)
+                response = request.execute(num_retries=API_NUM_RETRIES)
+                if response.get('items'):
+                    return self._channel_ids_from_item(response['items'][0])
                     
-            # Try as username
-            request = self.youtube.channels().list(
-                part='id',
-                forUsername=channel_identifier
-            )
-            response = request.execute()
+            # Try as legacy username
+            request = self.youtube.channels().list(forUsername=channel_identifier, **channel_params)
+            response = request.execute(num_retries=API_NUM_RETRIES)
             
             if response.get('items'):
-                return response['items'][0]['id']
+                return self._channel_ids_from_item(response['items'][0])
             else:
                 raise ValueError(f"Channel not found: {channel_identifier}")
                 
         except HttpError as e:
             raise Exception(f"Error getting channel ID: {e}")
     
+    @staticmethod
+    def _channel_ids_from_item(item: Dict) -> Tuple[str, str]:
+        """Extract (channel ID, uploads playlist ID) from a channels.list item"""
+        return item['id'], item['contentDetails']['relatedPlaylists']['uploads']
+    
     def get_channel_uploads_playlist_id(self, channel_id: str) -> str:
         """
         Get the uploads playlist ID for a channel
@@ -104,11 +227,12 @@ class YouTubeChannelScraper:
         try:
             request = self.youtube.channels().list(
                 part='contentDetails',
-                id=channel_id
+                id=channel_id,
+                fields='items/contentDetails/relatedPlaylists/uploads'
             )
-            response = request.execute()
+            response = request.execute(num_retries=API_NUM_RETRIES)
             
-            if response['items']:
+            if response.get('items'):
                 return response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
             else:
                 raise ValueError(f"No uploads playlist found for channel: {channel_id}")
@@ -117,15 +241,20 @@ class YouTubeChannelScraper:
             raise Exception(f"Error getting uploads playlist: {e}")
     
     def get_all_video_ids(self, channel_id: str, max_videos: int = None, 
-                         published_after: str = None, published_before: str = None) -> List[str]:
+                         published_after: str = None, published_before: str = None,
+                         uploads_playlist_id: str = None) -> List[str]:
         """
         Get all video IDs from a channel (latest first)
         
+        Walks the channel's uploads playlist (1 quota unit per page) and applies
+        the date filters client-side, instead of using search (100 units per page).
+        
         Args:
             channel_id: YouTube channel ID
             max_videos: Maximum number of videos to fetch (None for all)
             published_after: ISO 8601 date string (e.g., "2022-01-01T00:00:00Z")
             published_before: ISO 8601 date string (e.g., "2022-12-31T23:59:59Z")
+            uploads_playlist_id: Channel's uploads playlist ID (looked up if not given)
             
         Returns:
             List of video IDs (latest first)
@@ -133,6 +262,13 @@ class YouTubeChannelScraper:
         video_ids = []
         next_page_token = None
         
+        if not uploads_playlist_id:
+            uploads_playlist_id = self.get_channel_uploads_playlist_id(channel_id)
+        
+        # Normalize the bounds to UTC so they compare as strings against videoPublishedAt
+        published_after = self._normalize_date_bound(published_after, 'published_after')
+        published_before = self._normalize_date_bound(published_before, 'published_before')
+        
         print(f"Fetching video IDs from channel (latest first)...")
         if max_videos:
             print(f"Limiting to {max_videos} videos")
@@ -143,43 +279,50 @@ class YouTubeChannelScraper:
         
         while True:
             try:
-                # Build search parameters
-                search_params = {
-                    'part': 'id',
-                    'channelId': channel_id,
-                    'type': 'video',
-                    'order': 'date',  # Latest first
+                # Build playlist parameters
+                playlist_params = {
+                    'part': 'contentDetails',
+                    'playlistId': uploads_playlist_id,  # Uploads are listed latest first
                     'maxResults': 50,  # Maximum allowed by API
+                    'fields': 'items/contentDetails(videoId,videoPublishedAt),nextPageToken',
                 }
                 
                 # Add pagination token
                 if next_page_token:
-                    search_params['pageToken'] = next_page_token
-                
-                # Add date filters if provided
-                if published_after:
-                    search_params['publishedAfter'] = published_after
-                if published_before:
-                    search_params['publishedBefore'] = published_before
+                    playlist_params['pageToken'] = next_page_token
                 
-                request = self.youtube.search().list(**search_params)
-                response = request.execute()
+                request = self.youtube.playlistItems().list(**playlist_params)
+                response = request.execute(num_retries=API_NUM_RETRIES)
                 
                 if 'items' not in response:
                     print(f"Warning: No 'items' in response")
                     break
                 
-                # Extract video IDs
+                # Extract video IDs, filtering by date (ISO 8601 strings compare chronologically)
+                reached_start_date = False
                 for item in response['items']:
-                    video_ids.append(item['id']['videoId'])
+                    content_details = item['contentDetails']
+                    published_at = content_details.get('videoPublishedAt')
+                    
+                    # Private and deleted videos have no publish date
+                    if not published_at:
+                        continue
+                    published_at = published_at[:19] + 'Z'  # Drop any fractional seconds
+                    if published_before and published_at > published_before:
+                        continue
+                    if published_after and published_at < published_after:
+                        reached_start_date = True
+                        break
+                    
+                    video_ids.append(content_details['videoId'])
                     
                     # Stop if we've reached the limit
                     if max_videos and len(video_ids) >= max_videos:
                         break
                 
-                # Stop if we've reached the limit
-                if max_videos and len(video_ids) >= max_videos:
-                    video_ids = video_ids[:max_videos]  # Trim to exact limit
+                # Stop at the limit (the loop above never overshoots it), or once everything
+                # further down the playlist is older than the date range
+                if reached_start_date or (max_videos and len(video_ids) >= max_videos):
                     break
                 
                 # Check if there are more pages
@@ -188,12 +331,11 @@ class YouTubeChannelScraper:
                     break
                     
                 # Rate limiting
-                time.sleep(self.rate_limit_delay)
+                self._throttle_after_success()
                 
             except HttpError as e:
-                if e.resp.status == 403:
-                    print("Rate limit exceeded. Waiting 60 seconds...")
-                    time.sleep(60)
+                if e.resp.status in RATE_LIMIT_STATUSES:
+                    self._back_off(e)
                     continue
                 else:
                     raise Exception(f"Error fetching video IDs: {e}")
@@ -201,6 +343,26 @@ class YouTubeChannelScraper:
         print(f"Found {len(video_ids)} videos")
         return video_ids
     
+    @staticmethod
+    def _normalize_date_bound(value: Optional[str], name: str) -> Optional[str]:
+        """
+        Convert a date filter to the API's UTC timestamp format
+        
+        Args:
+            value: RFC 3339 / ISO 8601 date string (or None)
+            name: Parameter name, for the warning message
+            
+        Returns:
+            UTC timestamp string, or None if no value was given or it could not be parsed
+        """
+        if not value:
+            return None
+        try:
+            return _parse_rfc3339(value).strftime(API_DATETIME_FORMAT)
+        except ValueError:
+            print(f"Warning: Could not parse {name} date, ignoring it: {value}")
+            return None
+    
     def get_video_metadata(self, video_ids: List[str]) -> List[VideoMetadata]:
         """
         Get detailed metadata for a list of video IDs
@@ -211,40 +373,149 @@ class YouTubeChannelScraper:
         Returns:
             List of VideoMetadata objects
         """
-        videos_metadata = []
-        
-        # Process videos in batches of 50 (API limit)
+        # Process videos in batches of 50 (API limit), sending up to 50 batches
+        # per multipart HTTP batch request (also the API limit)
         batch_size = 50
+        requests_per_http_batch = 50
+        batches = [video_ids[i:i + batch_size] for i in range(0, len(video_ids), batch_size)]
+        http_batches = [batches[i:i + requests_per_http_batch]
+                        for i in range(0, len(batches), requests_per_http_batch)]
         
         print("Fetching video metadata...")
         
-        for i in tqdm(range(0, len(video_ids), batch_size), desc="Processing videos"):
-            batch = video_ids[i:i + batch_size]
+        http_batch_results = [[] for _ in http_batches]
+        with tqdm(total=len(video_ids), desc="Processing videos") as progress:
+            # Sub-request callbacks run on worker threads, so progress updates are serialized
+            progress_lock = threading.Lock()
             
+            def advance(count):
+                with progress_lock:
+                    progress.update(count)
+            
+            if len(http_batches) == 1:
+                # A single HTTP batch goes out on the main client and its warm connection
+                http_batch_results[0] = self._fetch_video_batches(http_batches[0], self.youtube, advance)
+            elif http_batches:
+                # Send HTTP batches concurrently, keeping results in the original (latest first) order
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = {
+                        executor.submit(self._fetch_video_batches, http_batch, None, advance): index
+                        for index, http_batch in enumerate(http_batches)
+                    }
+                    for future in as_completed(futures):
+                        http_batch_results[futures[future]] = future.result()
+        
+        return [video for batch_metadata in http_batch_results for video in batch_metadata]
+    
+    def _fetch_video_batches(self, batches: List[List[str]], youtube=None,
+                             on_progress: Optional[Callable[[int], None]] = None) -> List[VideoMetadata]:
+        """
+        Fetch metadata for several batches of up to 50 video IDs in one HTTP batch request
+        
+        Args:
+            batches: List of video ID batches (at most 50 batches)
+            youtube: API client to use (defaults to the calling thread's own client)
+            on_progress: Called with the number of videos in each finished batch
+            
+        Returns:
+            List of VideoMetadata objects, in batch order
+        """
+        if youtube is None:
+            youtube = get_thread_youtube_client(self.api_key)
+        batch_results = [[] for _ in batches]
+        retry_indexes = []
+        rate_limit_error = None
+        
+        def build_request(batch):
+            return youtube.videos().list(
+                part='snippet,statistics,contentDetails',
+                id=','.join(batch),
+                fields=VIDEO_FIELDS
+            )
+        
+        def finish(index):
+            if on_progress is not None:
+                on_progress(len(batches[index]))
+        
+        def collect(request_id, response, exception):
+            nonlocal rate_limit_error
+            index = int(request_id)
+            if exception is not None:
+                if isinstance(exception, HttpError) and exception.resp.status in RATE_LIMIT_STATUSES:
+                    # Progress is reported once the retry below finishes
+                    rate_limit_error = exception
+                    retry_indexes.append(index)
+                    return
+                print(f"Error fetching video metadata: {exception}")
+            else:
+                batch_results[index] = [
+                    self._parse_video_data(item) for item in response.get('items', [])
+                ]
+            finish(index)
+        
+        http_batch = youtube.new_batch_http_request(callback=collect)
+        for index, batch in enumerate(batches):
+            http_batch.add(build_request(batch), request_id=str(index))
+        
+        try:
+            http_batch.execute()
+        except HttpError as e:
+            # The whole batch failed (no callbacks ran), so every request in it is retried below
+            if e.resp.status in RATE_LIMIT_STATUSES:
+                rate_limit_error = e
+            retry_indexes = list(range(len(batches)))
+        
+        # Rate limiting
+        if rate_limit_error is not None:
+            self._back_off(rate_limit_error)
+        else:
+            self._throttle_after_success()
+        
+        # Retry failed requests one by one (with the client's exponential backoff) rather than dropping them
+        for index in retry_indexes:
             try:
-                request = self.youtube.videos().list(
-                    part='snippet,statistics,contentDetails',
-                    id=','.join(batch)
-                )
-                response = request.execute()
-                
-                for item in response['items']:
-                    video_metadata = self._parse_video_data(item)
-                    videos_metadata.append(video_metadata)
-                
-                # Rate limiting
-                time.sleep(self.rate_limit_delay)
-                
+                response = build_request(batches[index]).execute(num_retries=API_NUM_RETRIES)
+                batch_results[index] = [
+                    self._parse_video_data(item) for item in response.get('items', [])
+                ]
             except HttpError as e:
-                if e.resp.status == 403:
-                    print("Rate limit exceeded. Waiting 60 seconds...")
-                    time.sleep(60)
-                    continue
-                else:
-                    print(f"Error fetching video metadata: {e}")
-                    continue
+                print(f"Error fetching video metadata: {e}")
+            finish(index)
         
-        return videos_metadata
+        return [video for batch_metadata in batch_results for video in batch_metadata]
+    
+    def _throttle_after_success(self):
+        """Additively shrink the request delay after a successful call, then wait it out"""
+        with self._rate_limit_lock:
+            self.rate_limit_delay = max(0.0, self.rate_limit_delay - RATE_LIMIT_DELAY_STEP)
+            delay = self.rate_limit_delay
+        
+        if delay > 0:
+            time.sleep(delay)
+    
+    def _back_off(self, error: HttpError):
+        """
+        Multiplicatively grow the request delay after a rate-limit response, then wait
+        
+        Waits for the server's Retry-After (if given) or the new delay, whichever is
+        longer, plus random jitter so concurrent workers do not retry in lockstep.
+        
+        Args:
+            error: HttpError returned for the rate-limited request
+        """
+        with self._rate_limit_lock:
+            self.rate_limit_delay = min(RATE_LIMIT_MAX_BACKOFF,
+                                        max(RATE_LIMIT_MIN_BACKOFF, self.rate_limit_delay * 2))
+            delay = self.rate_limit_delay
+        
+        try:
+            retry_after = float(error.resp.get('retry-after', 0))
+        except (TypeError, ValueError):
+            retry_after = 0  # HTTP-date form; fall back to our own delay
+        
+        wait = max(delay, retry_after) + random.uniform(0, 1)
+        print(f"Rate limit exceeded. Waiting {wait:.1f} seconds...")
+        time.sleep(wait)
     
     def _parse_video_data(self, video_data: Dict) -> VideoMetadata:
         """
@@ -265,15 +536,7 @@ class YouTubeChannelScraper:
         
         # Get thumbnail URL (highest quality)
         thumbnails = snippet.get('thumbnails', {})
-        thumbnail_url = ''
-        if 'maxres' in thumbnails:
-            thumbnail_url = thumbnails['maxres']['url']
-        elif 'high' in thumbnails:
-            thumbnail_url = thumbnails['high']['url']
-        elif 'medium' in thumbnails:
-            thumbnail_url = thumbnails['medium']['url']
-        elif 'default' in thumbnails:
-            thumbnail_url = thumbnails['default']['url']
+        thumbnail_url = next((thumbnails[size]['url'] for size in THUMBNAIL_PRIORITY if size in thumbnails), '')
         
         return VideoMetadata(
             video_id=video_data['id'],
@@ -283,11 +546,11 @@ class YouTubeChannelScraper:
             channel_title=snippet.get('channelTitle', ''),
             published_at=snippet.get('publishedAt', ''),
             duration=duration,
-            view_count=int(statistics.get('viewCount', 0)),
-            like_count=int(statistics.get('likeCount', 0)),
-            comment_count=int(statistics.get('commentCount', 0)),
+            view_count=int(statistics.get('viewCount') or 0),
+            like_count=int(statistics.get('likeCount') or 0),
+            comment_count=int(statistics.get('commentCount') or 0),
             thumbnail_url=thumbnail_url,
-            tags=snippet.get('tags', []),
+            tags=tuple(snippet.get('tags', ())),
             category_id=snippet.get('categoryId', ''),
             language=snippet.get('defaultLanguage', '')
         )
@@ -303,34 +566,7 @@ class YouTubeChannelScraper:
         Returns:
             Human-readable duration (e.g., 4:13)
         """
-        if not duration:
-            return '0:00'
-        
-        # Remove PT prefix
-        duration = duration[2:]
-        
-        hours = 0
-        minutes = 0
-        seconds = 0
-        
-        # Parse hours
-        if 'H' in duration:
-            hours = int(duration.split('H')[0])
-            duration = duration.split('H')[1]
-        
-        # Parse minutes
-        if 'M' in duration:
-            minutes = int(duration.split('M')[0])
-            duration = duration.split('M')[1]
-        
-        # Parse seconds
-        if 'S' in duration:
-            seconds = int(duration.split('S')[0])
-        
-        if hours > 0:
-            return f"{hours}:{minutes:02d}:{seconds:02d}"
-        else:
-            return f"{minutes}:{seconds:02d}"
+        return _format_duration(duration)
     
     def scrape_channel(self, channel_identifier: str, max_videos: int = None, 
                       published_after: str = None, published_before: str = None, 
@@ -339,7 +575,7 @@ class YouTubeChannelScraper:
         Scrape videos from a YouTube channel (latest first)
         
         Args:
-            channel_identifier: Channel username or channel ID
+            channel_identifier: Channel handle (@name), username or channel ID
             max_videos: Maximum number of videos to scrape (None for all)
             published_after: ISO 8601 date string (e.g., "2022-01-01T00:00:00Z")
             published_before: ISO 8601 date string (e.g., "2022-12-31T23:59:59Z")
@@ -352,33 +588,32 @@ class YouTubeChannelScraper:
         
         # Apply buffer to dates if provided
         if published_after and buffer_days > 0:
-            from datetime import datetime, timedelta
             try:
                 # Parse the date and subtract buffer days
-                original_date = datetime.fromisoformat(published_after.replace('Z', '+00:00'))
+                original_date = _parse_rfc3339(published_after)
                 buffered_date = original_date - timedelta(days=buffer_days)
-                published_after = buffered_date.strftime('%Y-%m-%dT%H:%M:%SZ')
+                published_after = buffered_date.strftime(API_DATETIME_FORMAT)
                 print(f"Applied -{buffer_days} day buffer to start date: {published_after}")
             except ValueError:
                 print(f"Warning: Could not parse published_after date: {published_after}")
         
         if published_before and buffer_days > 0:
-            from datetime import datetime, timedelta
             try:
                 # Parse the date and add buffer days
-                original_date = datetime.fromisoformat(published_before.replace('Z', '+00:00'))
+                original_date = _parse_rfc3339(published_before)
                 buffered_date = original_date + timedelta(days=buffer_days)
-                published_before = buffered_date.strftime('%Y-%m-%dT%H:%M:%SZ')
+                published_before = buffered_date.strftime(API_DATETIME_FORMAT)
                 print(f"Applied +{buffer_days} day buffer to end date: {published_before}")
             except ValueError:
                 print(f"Warning: Could not parse published_before date: {published_before}")
         
-        # Get channel ID
-        channel_id = self.get_channel_id(channel_identifier)
+        # Get channel ID and uploads playlist in one call
+        channel_id, uploads_playlist_id = self._resolve_channel(channel_identifier)
         print(f"Channel ID: {channel_id}")
         
         # Get video IDs (latest first) with date filtering
-        video_ids = self.get_all_video_ids(channel_id, max_videos, published_after, published_before)
+        video_ids = self.get_all_video_ids(channel_id, max_videos, published_after, published_before,
+                                           uploads_playlist_id=uploads_playlist_id)
         
         if not video_ids:
             print("No videos found in channel")
@@ -391,8 +626,56 @@ class YouTubeChannelScraper:
         return videos_metadata
     
     
+    def _get_category_names(self, videos: List[VideoMetadata]) -> Dict[str, str]:
+        """
+        Resolve the category name of every distinct category ID in the videos
+        
+        Args:
+            videos: List of VideoMetadata objects
+            
+        Returns:
+            Dictionary mapping category ID to category name
+        """
+        return {
+            category_id: self.categories.get_category_name(category_id)
+            for category_id in {video.category_id for video in videos}
+        }
+    
+    def _iter_rows(self, videos: List[VideoMetadata], join_tags: bool) -> Iterator[Dict]:
+        """
+        Yield one export row per video, with keys in CSV_COLUMNS order
+        
+        Args:
+            videos: List of VideoMetadata objects
+            join_tags: Join tags into a comma-separated string (CSV) instead of a list (JSON)
+            
+        Yields:
+            Dictionary of video metadata including the category name
+        """
+        category_names = self._get_category_names(videos)
+        
+        for video in videos:
+            yield {
+                'video_id': video.video_id,
+                'url': video.url,
+                'title': video.title,
+                'description': video.description,
+                'channel_title': video.channel_title,
+                'published_at': video.published_at,
+                'duration': video.duration,
+                'view_count': video.view_count,
+                'like_count': video.like_count,
+                'comment_count': video.comment_count,
+                'thumbnail_url': video.thumbnail_url,
+                'tags': ', '.join(video.tags) if join_tags else video.tags,
+                'category_id': video.category_id,
+                'category_name': category_names[video.category_id],
+                'language': video.language
+            }
+    
     def save_to_csv(self, videos: List[VideoMetadata], filename: str = None, 
-                   channel_name: str = None, date_range: str = None):
+                   channel_name: str = None, date_range: str = None,
+                   timestamp: str = None, compress: bool = False):
         """
         Save video metadata to CSV file
         
@@ -401,13 +684,15 @@ class YouTubeChannelScraper:
             filename: Output filename (optional)
             channel_name: Channel name for filename
             date_range: Date range for filename
+            timestamp: Timestamp for filename (defaults to now, as YYYYmmdd_HHMMSS)
+            compress: Write a gzip-compressed file (adds a .gz suffix)
         """
         # Create result directory if it doesn't exist
         result_dir = "result"
         os.makedirs(result_dir, exist_ok=True)
         
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
             if channel_name and date_range:
                 # Clean channel name for filename
                 clean_channel = channel_name.replace(' ', '_').replace('@', '').replace('/', '_')
@@ -418,30 +703,19 @@ class YouTubeChannelScraper:
         # Add result directory to filename
         filename = os.path.join(result_dir, filename)
         
-        # Convert to DataFrame
-        data = []
-        for video in videos:
-            category_name = self.categories.get_category_name(video.category_id)
-            data.append({
-                'video_id': video.video_id,
-                'url': video.url,
-                'title': video.title,
-                'description': video.description,
-                'channel_title': video.channel_title,
-                'published_at': video.published_at,
-                'duration': video.duration,
-                'view_count': video.view_count,
-                'like_count': video.like_count,
-                'comment_count': video.comment_count,
-                'thumbnail_url': video.thumbnail_url,
-                'tags': ', '.join(video.tags),
-                'category_id': video.category_id,
-                'category_name': category_name,
-                'language': video.language
-            })
+        # Titles and descriptions compress well, so gzip is worth it for large channels
+        if compress:
+            if not filename.endswith('.gz'):
+                filename += '.gz'
+            f = gzip.open(filename, 'wt', newline='', encoding='utf-8')
+        else:
+            f = open(filename, 'w', newline='', encoding='utf-8')
         
-        df = pd.DataFrame(data)
-        df.to_csv(filename, index=False, encoding='utf-8')
+        # Stream rows straight from the dataclasses
+        with f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(CSV_COLUMNS)
+            writer.writerows(row.values() for row in self._iter_rows(videos, join_tags=True))
         print(f"Data saved to {filename}")
     
     def get_category_statistics(self, videos: List[VideoMetadata]):
@@ -455,20 +729,15 @@ class YouTubeChannelScraper:
             print("No videos to analyze")
             return
         
-        # Convert to dictionary format for categories helper
-        videos_data = []
-        for video in videos:
-            videos_data.append({
-                'category_id': video.category_id,
-                'title': video.title,
-                'view_count': video.view_count
-            })
+        # Convert to dictionary format for categories helper (only the category is aggregated)
+        videos_data = [{'category_id': video.category_id} for video in videos]
         
         # Print category statistics
         self.categories.print_category_stats(videos_data)
     
     def save_to_json(self, videos: List[VideoMetadata], filename: str = None,
-                    channel_name: str = None, date_range: str = None):
+                    channel_name: str = None, date_range: str = None,
+                    timestamp: str = None):
         """
         Save video metadata to JSON file
         
@@ -477,13 +746,14 @@ class YouTubeChannelScraper:
             filename: Output filename (optional)
             channel_name: Channel name for filename
             date_range: Date range for filename
+            timestamp: Timestamp for filename (defaults to now, as YYYYmmdd_HHMMSS)
         """
         # Create result directory if it doesn't exist
         result_dir = "result"
         os.makedirs(result_dir, exist_ok=True)
         
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
             if channel_name and date_range:
                 # Clean channel name for filename
                 clean_channel = channel_name.replace(' ', '_').replace('@', '').replace('/', '_')
@@ -495,29 +765,14 @@ class YouTubeChannelScraper:
         filename = os.path.join(result_dir, filename)
         
         # Convert to dictionary format
-        data = []
-        for video in videos:
-            category_name = self.categories.get_category_name(video.category_id)
-            data.append({
-                'video_id': video.video_id,
-                'url': video.url,
-                'title': video.title,
-                'description': video.description,
-                'channel_title': video.channel_title,
-                'published_at': video.published_at,
-                'duration': video.duration,
-                'view_count': video.view_count,
-                'like_count': video.like_count,
-                'comment_count': video.comment_count,
-                'thumbnail_url': video.thumbnail_url,
-                'tags': video.tags,
-                'category_id': video.category_id,
-                'category_name': category_name,
-                'language': video.language
-            })
+        data = list(self._iter_rows(videos, join_tags=False))
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(data, indent=2, ensure_ascii=False))
         
         print(f"Data saved to {filename}")
     
@@ -572,6 +827,9 @@ def main():
     else:
         buffer_days = 0
     
+    # Optionally gzip the CSV output
+    compress_csv = os.getenv('COMPRESS_CSV', '').lower() in ('1', 'true', 'yes')
+    
     try:
         # Initialize scraper
         scraper = YouTubeChannelScraper(api_key)
@@ -595,19 +853,27 @@ def main():
             else:
                 date_range = "all_dates"
             
-            # Save to both CSV and JSON with descriptive filenames
-            scraper.save_to_csv(videos, channel_name=channel_name, date_range=date_range)
-            scraper.save_to_json(videos, channel_name=channel_name, date_range=date_range)
+            # Save to both CSV and JSON with descriptive filenames (sharing one timestamp)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            scraper.save_to_csv(videos, channel_name=channel_name, date_range=date_range,
+                                timestamp=timestamp, compress=compress_csv)
+            scraper.save_to_json(videos, channel_name=channel_name, date_range=date_range,
+                                 timestamp=timestamp)
             
             # Print category statistics
             scraper.get_category_statistics(videos)
             
             # Print basic summary
             print(f"\nScraping completed!")
+            total_views = total_likes = total_comments = 0
+            for v in videos:
+                total_views += v.view_count
+                total_likes += v.like_count
+                total_comments += v.comment_count
             print(f"Total videos: {len(videos)}")
-            print(f"Total views: {sum(v.view_count for v in videos):,}")
-            print(f"Total likes: {sum(v.like_count for v in videos):,}")
-            print(f"Total comments: {sum(v.comment_count for v in videos):,}")
+            print(f"Total views: {total_views:,}")
+            print(f"Total likes: {total_likes:,}")
+            print(f"Total comments: {total_comments:,}")
         else:
             print("No videos found")
             